@@ -0,0 +1,142 @@
+# benchmark_surfaces.py
+"""
+draw_menu ve draw_game kare sürelerini üç yol için ölçer, ardından asset başına
+bellek ve blit maliyeti raporunu yazdırır:
+  - eski:        surface hazırlama öncesi çizim kodu (LegacyUIManager); yazılar ve
+                 referans resim her karede yeniden üretilir, her şey convert_alpha
+  - yalnız format: güncel UIManager (önbellekler açık) ama surface_utils kapalı
+  - yeni:        güncel UIManager + surface hazırlama katmanı
+
+"eski -> yeni" isteğin toplam kazancı, "yalnız format -> yeni" yalnızca surface
+formatı ve sabit katmanların birleştirilmesinin payıdır.
+
+Kamera gerekmez; SDL dummy video sürücüsüyle pencere açmadan çalışır.
+Kullanım:
+    python benchmark_surfaces.py --frames 300 --grid-size 4
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import surface_utils
+from settings import *
+from ui_manager import UIManager
+from puzzle_manager import PuzzleManager
+
+
+class LegacyUIManager(UIManager):
+    """Surface hazırlama katmanından önceki draw_menu / draw_game (karşılaştırma için birebir)."""
+
+    def draw_menu(self, hand_data, hovered_key=None):
+        self._draw_background()
+
+        title = self.big_font.render("DÜZEY SEÇİN", True, NEON_ORANGE)
+        self.screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 80))
+
+        buttons = []
+        labels = [("kolay", "KOLAY"), ("orta", "ORTA"), ("zor", "ZOR")]
+        start_y = 240
+        gap = 120
+        for i, (key, label) in enumerate(labels):
+            rect = pygame.Rect(WINDOW_WIDTH // 2 - 200, start_y + i * gap, 400, 90)
+            is_hover = (hovered_key == key)
+            base_color = NEON_ORANGE if is_hover else NEON_BLUE
+
+            pygame.draw.rect(self.screen, base_color, rect, border_radius=14)
+            txt = self.font.render(label, True, WHITE)
+            self.screen.blit(txt, (rect.centerx - txt.get_width() // 2, rect.centery - txt.get_height() // 2))
+            pygame.draw.rect(self.screen, NEON_GREEN if is_hover else NEON_BLUE, rect, 3 if is_hover else 2,
+                             border_radius=14)
+            buttons.append((key, rect))
+
+        self._draw_cursor(hand_data)
+        pygame.display.flip()
+        return buttons
+
+    def draw_game(self, hand_data, puzzle, game_state, elapsed_time):
+        self._draw_background()
+        self.screen.blit(self.puzzle_overlay_surface, self.puzzle_display_area_rect.topleft)
+
+        ref_w = int(PUZZLE_BOARD_SIZE * 0.5)
+        ref_image = pygame.transform.scale(puzzle.original_image, (ref_w, ref_w))
+        self.screen.blit(ref_image, (Y_MARGIN, Y_MARGIN))
+        pygame.draw.rect(self.screen, NEON_BLUE, (Y_MARGIN, Y_MARGIN, ref_w, ref_w), 2, border_radius=8)
+
+        puzzle.draw(self.screen, self.puzzle_area_pos, show_blank=(game_state == 'WON'))
+        self._draw_timer(elapsed_time)
+        self._draw_cursor(hand_data)
+
+        if game_state == 'WON':
+            self._draw_win_screen(elapsed_time)
+
+        pygame.display.flip()
+
+
+def _first_image():
+    for folder in (IMAGES_FOLDER_ORTA, IMAGES_FOLDER_KOLAY, IMAGES_FOLDER_ZOR):
+        if os.path.isdir(folder):
+            for f in sorted(os.listdir(folder)):
+                if os.path.splitext(f)[1].lower() in ('.png', '.jpg', '.jpeg'):
+                    return os.path.join(folder, f)
+    return None
+
+
+def _time_frames(draw, frames):
+    draw()  # ısınma (RLE kodlama, önbellekler)
+    started = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - started) / frames * 1000.0
+
+
+def run_mode(optimized, image_path, grid_size, frames, ui_class=UIManager):
+    surface_utils.enabled = optimized
+    ui = ui_class()
+    puzzle = PuzzleManager(surface_utils.load_surface(image_path), grid_size=grid_size)
+    hand_data = {"cursor_pos": (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2), "pinch_active": False}
+    timings = {
+        "draw_menu": _time_frames(lambda: ui.draw_menu(hand_data, hovered_key="orta"), frames),
+        "draw_game": _time_frames(lambda: ui.draw_game(hand_data, puzzle, "PLAYING", 12.0), frames),
+    }
+    # Rapor kayıtları weakref; ui ve puzzle rapor bitene kadar canlı kalmalı
+    return timings, (ui, puzzle)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Surface hazırlama katmanı kare süresi benchmark'ı")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--grid-size", type=int, default=3)
+    parser.add_argument("--image", default=None)
+    parser.add_argument("--repeats", type=int, default=200, help="Rapor için asset başına blit sayısı")
+    args = parser.parse_args(argv)
+
+    image_path = args.image or _first_image()
+    if image_path is None:
+        print("Benchmark için resim bulunamadı.")
+        return 1
+
+    pygame.init()
+    legacy = run_mode(False, image_path, args.grid_size, args.frames, LegacyUIManager)[0]
+    format_only = run_mode(False, image_path, args.grid_size, args.frames)[0]
+    optimized, alive = run_mode(True, image_path, args.grid_size, args.frames)
+
+    print(f"\n{'':<12}{'eski ms':>10}{'yalnız format ms':>18}{'yeni ms':>10}"
+          f"{'eski->yeni':>12}{'format->yeni':>14}")
+    for key in ("draw_menu", "draw_game"):
+        total = legacy[key] / optimized[key] if optimized[key] else 0.0
+        surfaces = format_only[key] / optimized[key] if optimized[key] else 0.0
+        print(f"{key:<12}{legacy[key]:>10.3f}{format_only[key]:>18.3f}{optimized[key]:>10.3f}"
+              f"{total:>11.2f}x{surfaces:>13.2f}x")
+
+    print()
+    surface_utils.print_surface_report(args.repeats)
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
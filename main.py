@@ -6,6 +6,10 @@ from settings import *
 from hand_tracker import HandTracker
 from ui_manager import UIManager
 from puzzle_manager import PuzzleManager
+from puzzle_generator import load_puzzle_bank
+from surface_utils import load_surface
+
+_puzzle_banks = {}
 
 
 def get_random_image_path_for_difficulty(difficulty):
@@ -25,13 +29,23 @@ def get_random_image_path_for_difficulty(difficulty):
     return os.path.join(folder, random.choice(files))
 
 
+def sample_board_for_grid(grid_size, difficulty):
+    """
+    puzzle_generator ile üretilmiş banka varsa, zorluğun çözüm uzunluğu aralığından
+    O(1) tahta örnekler. Banka yoksa veya aralık boşsa None (rastgele karıştırma).
+    """
+    if grid_size not in _puzzle_banks:
+        _puzzle_banks[grid_size] = load_puzzle_bank(grid_size)
+    bank = _puzzle_banks[grid_size]
+    if bank is None:
+        return None
+    min_length, max_length = DIFFICULTY_SOLUTION_LENGTHS.get(difficulty, (None, None))
+    return bank.sample(min_length, max_length)
+
+
 def load_image_safe(path):
     try:
-        img = pygame.image.load(path)
-        try:
-            return img.convert_alpha()
-        except Exception:
-            return img.convert()
+        return load_surface(path)
     except Exception as e:
         print("Resim yüklenemedi:", e)
         return None
@@ -142,7 +156,7 @@ def main():
                 print("Resim yüklenemedi, çıkılıyor.")
                 break
 
-            puzzle = PuzzleManager(image, grid_size=grid_size)
+            puzzle = PuzzleManager(image, grid_size=grid_size, board=sample_board_for_grid(grid_size, difficulty))
 
             game_state = "PLAYING"
             start_ticks = pygame.time.get_ticks()
@@ -179,7 +193,8 @@ def main():
                             paused_time_accum += (pygame.time.get_ticks() - pause_started_at)
                             pause_started_at = None
                     elif choice == "yeniden":
-                        puzzle = PuzzleManager(image, grid_size=grid_size)
+                        puzzle = PuzzleManager(image, grid_size=grid_size,
+                                               board=sample_board_for_grid(grid_size, difficulty))
                         game_state = "PLAYING"
                         start_ticks = pygame.time.get_ticks()
                         paused_time_accum = 0
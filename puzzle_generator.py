@@ -0,0 +1,648 @@
+# puzzle_generator.py
+"""
+Çevrimdışı toplu puzzle üretici ve zorluk kalibrasyon aracı.
+
+PuzzleManager'ın desteklediği her grid boyutu için çözülebilir tahtalar üretir,
+her tahta için çözüm uzunluğunu (optimal ya da düğüm bütçesi aşılırsa alt sınır),
+sezgisel değerleri ve dallanma istatistiklerini hesaplar. Sonuçlar sabit boyutlu
+kayıtlardan oluşan ikili bir dosyaya akıtılır; sonuna çözüm uzunluğuna göre
+sıralı bir indeks eklenir. Oyun PuzzleBank ile bu dosyayı mmap üzerinden açar ve
+istenen uzunluk aralığından sabit zamanda örnekler.
+
+Dosya düzeni:
+    başlık | kayıtlar | uzunluk tablosu (uint32 x table_len) | indeks (uint32 x count)
+    Uzunluk tablosunda starts[L], uzunluğu L olan ilk kaydın indeksteki konumudur;
+    son eleman count'tur. Bir [lo, hi] aralığı indekste starts[lo]..starts[hi+1]'dir.
+
+Kullanım:
+    python puzzle_generator.py --grid-sizes 2 3 4 --count 100000 --workers 8
+
+Bu modül pygame import etmez; worker süreçleri hafif kalır.
+"""
+import argparse
+import array
+import math
+import mmap
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import time
+
+from settings import PUZZLE_BANK_FOLDER
+
+BANK_MAGIC = b"SPZB"
+BANK_VERSION = 2
+# magic, version, grid_size, record_size, count, index_offset, table_len
+HEADER_FORMAT = "<4sHHIQQI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# solution_length, lower_bound, manhattan, linear_conflict, misplaced,
+# flags, nodes_expanded, nodes_generated, effective_branching
+STATS_FORMAT = "<HHHHBBIIf"
+STATS_SIZE = struct.calcsize(STATS_FORMAT)
+
+FLAG_OPTIMAL = 0x01
+
+SUPPORTED_GRID_SIZES = (2, 3, 4)
+DEFAULT_NODE_LIMIT = 200000
+
+
+def bank_path(grid_size, folder=PUZZLE_BANK_FOLDER):
+    return os.path.join(folder, f"grid_{grid_size}.bin")
+
+
+def record_size(grid_size):
+    return grid_size * grid_size + STATS_SIZE
+
+
+def _length_at(data, rec_size, grid_size, i):
+    """Paketlenmiş kayıt dizisindeki i. kaydın solution_length alanı."""
+    return struct.unpack_from("<H", data, i * rec_size + grid_size * grid_size)[0]
+
+
+# ---------------------------------------------------------------------------
+# Tahta üretimi ve sezgiseller
+# Tahta düz bir tuple'dır (satır satır tile id'leri); boş kare id'si n*n-1,
+# yani PuzzleManager.blank_tile_id ile aynı kural.
+# ---------------------------------------------------------------------------
+
+def is_solvable(board, grid_size):
+    """Permütasyon paritesi ile çözülebilirlik kontrolü."""
+    blank = grid_size * grid_size - 1
+    tiles = [t for t in board if t != blank]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    if grid_size % 2 == 1:
+        return inversions % 2 == 0
+    # Çift genişlik: boşun alttan kaçıncı satırda olduğu da pariteye girer
+    blank_row_from_bottom = grid_size - board.index(blank) // grid_size
+    return (inversions + blank_row_from_bottom) % 2 == 1
+
+
+def random_solvable_board(grid_size, rng):
+    """Çözülebilir tahtalar arasından düzgün dağılımlı rastgele (çözülmüş hal hariç) bir tahta döner."""
+    solved = tuple(range(grid_size * grid_size))
+    board = list(solved)
+    while True:
+        rng.shuffle(board)
+        candidate = tuple(board)
+        if candidate != solved and is_solvable(candidate, grid_size):
+            return candidate
+
+
+def manhattan_distance(board, grid_size):
+    blank = grid_size * grid_size - 1
+    total = 0
+    for idx, tile in enumerate(board):
+        if tile == blank:
+            continue
+        total += abs(idx // grid_size - tile // grid_size) + abs(idx % grid_size - tile % grid_size)
+    return total
+
+
+def _line_conflict(goals):
+    """
+    Hedefi bu satır/sütun olan tile'ların hedef konumları (soldan sağa) verildiğinde ek maliyet.
+    En uzun artan alt dizi dışında kalan her tile hattı terk edip dönmek zorunda: +2.
+    (Ters çift sayısı ile +2 saymak kabul edilebilir değildir; [2,1,0] için +6 verir.)
+    """
+    k = len(goals)
+    if k < 2:
+        return 0
+    best = [1] * k
+    for i in range(1, k):
+        for j in range(i):
+            if goals[j] < goals[i] and best[j] + 1 > best[i]:
+                best[i] = best[j] + 1
+    return 2 * (k - max(best))
+
+
+def _row_conflict(board, grid_size, row):
+    blank = grid_size * grid_size - 1
+    return _line_conflict([t % grid_size for t in board[row * grid_size:(row + 1) * grid_size]
+                           if t != blank and t // grid_size == row])
+
+
+def _col_conflict(board, grid_size, col):
+    blank = grid_size * grid_size - 1
+    return _line_conflict([t // grid_size for t in board[col::grid_size]
+                           if t != blank and t % grid_size == col])
+
+
+def linear_conflict(board, grid_size):
+    """Manhattan'a eklenebilir linear conflict değeri (satırlar + sütunlar)."""
+    return sum(_row_conflict(board, grid_size, line) + _col_conflict(board, grid_size, line)
+               for line in range(grid_size))
+
+
+def misplaced_tiles(board, grid_size):
+    blank = grid_size * grid_size - 1
+    return sum(1 for idx, tile in enumerate(board) if tile != blank and tile != idx)
+
+
+def _neighbor_table(grid_size):
+    table = []
+    for idx in range(grid_size * grid_size):
+        r, c = divmod(idx, grid_size)
+        moves = []
+        if r > 0: moves.append(idx - grid_size)
+        if r < grid_size - 1: moves.append(idx + grid_size)
+        if c > 0: moves.append(idx - 1)
+        if c < grid_size - 1: moves.append(idx + 1)
+        table.append(tuple(moves))
+    return table
+
+
+def _effective_branching_factor(nodes, depth):
+    """N = b + b^2 + ... + b^d denklemini b için ikiye bölme ile çözer."""
+    if depth <= 0 or nodes <= depth:
+        return 1.0
+    lo, hi = 1.0, float(nodes)
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        total = 0.0
+        term = 1.0
+        for _ in range(depth):
+            term *= mid
+            total += term
+            if total > nodes:
+                break
+        if total > nodes:
+            hi = mid
+        else:
+            lo = mid
+    return (lo + hi) / 2
+
+
+# ---------------------------------------------------------------------------
+# IDA* çözücü (Manhattan + linear conflict ile)
+# ---------------------------------------------------------------------------
+
+def solve(board, grid_size, node_limit=DEFAULT_NODE_LIMIT):
+    """
+    IDA* ile tahtayı çözmeye çalışır.
+    Döner: (length, optimal, nodes_expanded, nodes_generated)
+      - optimal True ise length optimal çözüm uzunluğudur.
+      - Düğüm bütçesi aşılırsa optimal False ve length kanıtlanmış alt sınırdır.
+    """
+    size = grid_size * grid_size
+    blank = size - 1
+    neighbors = _neighbor_table(grid_size)
+    state = list(board)
+    goal_row = [t // grid_size for t in range(size)]
+    goal_col = [t % grid_size for t in range(size)]
+
+    # Her satır/sütunun linear conflict katkısı; bir hamle yalnızca iki hattı değiştirir
+    row_lc = [_row_conflict(state, grid_size, r) for r in range(grid_size)]
+    col_lc = [_col_conflict(state, grid_size, c) for c in range(grid_size)]
+
+    md0 = manhattan_distance(board, grid_size)
+    lc0 = sum(row_lc) + sum(col_lc)
+    bound = md0 + lc0
+    expanded = 0
+    generated = 0
+
+    if md0 == 0:
+        return 0, True, 0, 0
+
+    def search(blank_idx, prev_idx, g, md, lc, bound):
+        # Döner: (bulundu mu, bir sonraki eşik adayı)
+        nonlocal expanded, generated
+        f = g + md + lc
+        if f > bound:
+            return False, f
+        if md == 0:
+            return True, g
+        if expanded >= node_limit:
+            return False, None
+        expanded += 1
+        minimum = None
+        for nxt in neighbors[blank_idx]:
+            if nxt == prev_idx:
+                continue
+            generated += 1
+            tile = state[nxt]
+            # tile nxt'den blank_idx'e kayar; Manhattan'ı artımlı güncelle
+            old = abs(nxt // grid_size - goal_row[tile]) + abs(nxt % grid_size - goal_col[tile])
+            new = abs(blank_idx // grid_size - goal_row[tile]) + abs(blank_idx % grid_size - goal_col[tile])
+            state[blank_idx], state[nxt] = tile, blank
+            # Yatay hamle tile'ın sütununu, dikey hamle satırını değiştirir;
+            # diğer yöndeki hatlarda tile'ların sırası aynı kalır.
+            if nxt // grid_size == blank_idx // grid_size:
+                lines, a, b = col_lc, nxt % grid_size, blank_idx % grid_size
+                line_conflict = _col_conflict
+            else:
+                lines, a, b = row_lc, nxt // grid_size, blank_idx // grid_size
+                line_conflict = _row_conflict
+            old_a, old_b = lines[a], lines[b]
+            lines[a] = line_conflict(state, grid_size, a)
+            lines[b] = line_conflict(state, grid_size, b)
+            new_lc = lc - old_a - old_b + lines[a] + lines[b]
+            found, value = search(nxt, blank_idx, g + 1, md - old + new, new_lc, bound)
+            lines[a], lines[b] = old_a, old_b
+            state[blank_idx], state[nxt] = blank, tile
+            if found:
+                return True, value
+            if value is None:
+                return False, None
+            if minimum is None or value < minimum:
+                minimum = value
+        return False, minimum
+
+    blank_start = board.index(blank)
+    while True:
+        found, value = search(blank_start, -1, 0, md0, lc0, bound)
+        if found:
+            return value, True, expanded, generated
+        if value is None:
+            # Bütçe bitti: mevcut eşik kanıtlanmış bir alt sınır
+            return bound, False, expanded, generated
+        bound = value
+
+
+def analyze_board(board, grid_size, node_limit=DEFAULT_NODE_LIMIT):
+    """Tek bir tahta için tüm istatistikleri içeren dict döner."""
+    manhattan = manhattan_distance(board, grid_size)
+    conflict = linear_conflict(board, grid_size)
+    length, optimal, expanded, generated = solve(board, grid_size, node_limit)
+    return {
+        "board": board,
+        "solution_length": length,
+        "lower_bound": manhattan + conflict,
+        "manhattan": manhattan,
+        "linear_conflict": conflict,
+        "misplaced": misplaced_tiles(board, grid_size),
+        "optimal": optimal,
+        "nodes_expanded": expanded,
+        "nodes_generated": generated,
+        "effective_branching": _effective_branching_factor(generated, length),
+    }
+
+
+def pack_record(stats, grid_size):
+    return bytes(stats["board"]) + struct.pack(
+        STATS_FORMAT,
+        stats["solution_length"],
+        stats["lower_bound"],
+        stats["manhattan"],
+        stats["linear_conflict"],
+        stats["misplaced"],
+        FLAG_OPTIMAL if stats["optimal"] else 0,
+        min(stats["nodes_expanded"], 0xFFFFFFFF),
+        min(stats["nodes_generated"], 0xFFFFFFFF),
+        stats["effective_branching"],
+    )
+
+
+def unpack_record(data, grid_size):
+    cells = grid_size * grid_size
+    board = tuple(data[:cells])
+    (length, lower_bound, manhattan, conflict, misplaced, flags,
+     expanded, generated, branching) = struct.unpack_from(STATS_FORMAT, data, cells)
+    return {
+        "board": board,
+        "solution_length": length,
+        "lower_bound": lower_bound,
+        "manhattan": manhattan,
+        "linear_conflict": conflict,
+        "misplaced": misplaced,
+        "optimal": bool(flags & FLAG_OPTIMAL),
+        "nodes_expanded": expanded,
+        "nodes_generated": generated,
+        "effective_branching": branching,
+    }
+
+
+def _generate_chunk(args):
+    """Worker görevi: bir parça tahta üretir; kayıtlar, CPU süresi ve üretilen düğüm sayısını döner."""
+    grid_size, start, count, seed, node_limit = args
+    started = time.process_time()
+    out = bytearray()
+    nodes = 0
+    for board_index in range(start, start + count):
+        # Tahta başına tohum: çıktı chunk boyutundan ve worker sayısından bağımsız
+        rng = random.Random((seed << 32) + board_index)
+        stats = analyze_board(random_solvable_board(grid_size, rng), grid_size, node_limit)
+        nodes += stats["nodes_generated"] + 1
+        out += pack_record(stats, grid_size)
+    return count, bytes(out), time.process_time() - started, nodes
+
+
+# ---------------------------------------------------------------------------
+# Çalışma zamanı okuyucu
+# ---------------------------------------------------------------------------
+
+class PuzzleBank:
+    """
+    generate_bank ile üretilen dosyayı mmap ile açar.
+    Kayıtlar sabit boyutlu ve uzunluk indeksi sıralı olduğundan __getitem__ ve
+    sample() O(1)'dir.
+    sample() -> (grid, blank_pos); PuzzleManager(board=...) ile doğrudan kullanılabilir.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Boş puzzle bankası: {path}")
+        if len(self._mm) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"Geçersiz puzzle bankası: {path}")
+        (magic, version, grid_size, rec_size, count,
+         index_offset, table_len) = struct.unpack_from(HEADER_FORMAT, self._mm, 0)
+        if magic != BANK_MAGIC or version != BANK_VERSION or rec_size != record_size(grid_size):
+            self.close()
+            raise ValueError(f"Geçersiz puzzle bankası: {path}")
+        # Yarıda kesilmiş bir üretimde indeks yazılmamış olur
+        if (not index_offset or not table_len
+                or index_offset + 4 * (table_len + count) > len(self._mm)):
+            self.close()
+            raise ValueError(f"Tamamlanmamış puzzle bankası: {path}")
+        # Kayıt alanı indeksle çakışmamalı; uzunluk tablosu artan olmalı ve count ile bitmeli
+        starts = struct.unpack_from(f"<{table_len}I", self._mm, index_offset)
+        index_base = index_offset + 4 * table_len
+        index = array.array("I", self._mm[index_base:index_base + 4 * count])
+        if sys.byteorder != "little":
+            index.byteswap()
+        if (HEADER_SIZE + count * rec_size > index_offset
+                or starts[0] != 0 or starts[-1] != count
+                or any(starts[i] > starts[i + 1] for i in range(table_len - 1))
+                or (count and max(index) >= count)):
+            self.close()
+            raise ValueError(f"Geçersiz puzzle bankası: {path}")
+        self.grid_size = grid_size
+        self.record_size = rec_size
+        self.count = count
+        self._starts = starts
+        self._index_base = index_base
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        offset = HEADER_SIZE + index * self.record_size
+        return unpack_record(self._mm[offset:offset + self.record_size], self.grid_size)
+
+    def _index_range(self, min_length, max_length):
+        """[min_length, max_length] uzunluk aralığının indeksteki (başlangıç, bitiş) konumları."""
+        last = len(self._starts) - 1
+
+        def position(length):
+            return self._starts[min(max(length, 0), last)]
+
+        lo = position(min_length) if min_length is not None else 0
+        hi = position(max_length + 1) if max_length is not None else self.count
+        return lo, hi
+
+    def count_in_range(self, min_length=None, max_length=None):
+        lo, hi = self._index_range(min_length, max_length)
+        return max(0, hi - lo)
+
+    def sample(self, min_length=None, max_length=None, rng=random):
+        """
+        solution_length'i [min_length, max_length] aralığında rastgele bir tahta döner.
+        Aralıkta kayıt yoksa veya seçilen kayıt bozuksa None.
+        """
+        lo, hi = self._index_range(min_length, max_length)
+        if hi <= lo:
+            return None
+        pos = rng.randrange(lo, hi)
+        record = struct.unpack_from("<I", self._mm, self._index_base + 4 * pos)[0]
+        offset = HEADER_SIZE + record * self.record_size
+        flat = self._mm[offset:offset + self.grid_size * self.grid_size]
+        n = self.grid_size
+        if sorted(flat) != list(range(n * n)):
+            return None  # bozuk kayıt; çağıran rastgele karıştırmaya döner
+        grid = [list(flat[i * n:(i + 1) * n]) for i in range(n)]
+        blank_idx = flat.index(n * n - 1)
+        return grid, (blank_idx // n, blank_idx % n)
+
+    def length_counts(self):
+        """{solution_length: kayıt sayısı}; uzunluk tablosundan, kayıtları okumadan."""
+        return {length: self._starts[length + 1] - self._starts[length]
+                for length in range(len(self._starts) - 1)
+                if self._starts[length + 1] > self._starts[length]}
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+
+def load_puzzle_bank(grid_size, folder=PUZZLE_BANK_FOLDER):
+    """Grid boyutu için banka varsa PuzzleBank, yoksa/bozuksa None döner."""
+    path = bank_path(grid_size, folder)
+    if not os.path.exists(path):
+        return None
+    try:
+        bank = PuzzleBank(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Puzzle bankası açılamadı ({path}): {e}")
+        return None
+    if bank.grid_size != grid_size:
+        print(f"Puzzle bankası açılamadı ({path}): grid boyutu {bank.grid_size}, beklenen {grid_size}")
+        bank.close()
+        return None
+    if len(bank) == 0:
+        bank.close()
+        return None
+    return bank
+
+
+# ---------------------------------------------------------------------------
+# Toplu üretim
+# ---------------------------------------------------------------------------
+
+def measure_baseline(grid_size, seconds, node_limit=DEFAULT_NODE_LIMIT, seed=None):
+    """
+    Ölçeklenme karşılaştırması için tek süreçte (pool'suz) düğüm/sn ölçer; kayıtlar atılır.
+    Tahta başı maliyet çok değiştiğinden tahta/sn yerine üretilen düğüm (+1/tahta) sayılır.
+    """
+    if seconds <= 0:
+        return None
+    rng = random.Random(seed)
+    nodes = 0
+    started = time.perf_counter()
+    while True:
+        stats = analyze_board(random_solvable_board(grid_size, rng), grid_size, node_limit)
+        nodes += stats["nodes_generated"] + 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return nodes / elapsed
+
+
+def generate_bank(grid_size, count, workers, chunk_size=500, node_limit=DEFAULT_NODE_LIMIT,
+                  seed=None, folder=PUZZLE_BANK_FOLDER, baseline_seconds=2.0):
+    """
+    count adet tahtayı process pool ile üretip bank_path(grid_size)'a akıtır.
+    baseline_seconds > 0 ise önce tek worker hızı ölçülür ve gerçek ölçeklenme raporlanır.
+    Döner: throughput raporu için istatistik dict'i.
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = bank_path(grid_size, folder)
+    base_seed = seed if seed is not None else random.randrange(1 << 62)
+    single_worker = measure_baseline(grid_size, baseline_seconds, node_limit, base_seed - 1)
+
+    # Her worker'a en az ~4 görev düşsün; büyük chunk_size küçük işlerde worker'ları boş bırakmasın
+    chunk_size = max(1, min(chunk_size, math.ceil(count / (workers * 4))))
+    tasks = [(grid_size, start, min(chunk_size, count - start), base_seed + grid_size, node_limit)
+             for start in range(0, count, chunk_size)]
+
+    rec_size = record_size(grid_size)
+    lengths = array.array("H")  # kayıt sırasıyla solution_length; indeks için
+    written = 0
+    cpu_time = 0.0
+    nodes = 0
+    # Oyunun okuduğu canlı banka üretim boyunca bozulmasın: önce geçici dosyaya yaz,
+    # başlık tamamlandıktan sonra tek adımda yerine koy. Yarıda kesilirse eski banka kalır.
+    tmp_path = path + ".tmp"
+    started = time.perf_counter()
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack(HEADER_FORMAT, BANK_MAGIC, BANK_VERSION, grid_size, rec_size, 0, 0, 0))
+            with multiprocessing.Pool(processes=workers) as pool:
+                # imap sıralı döner: aynı --seed ve --count aynı dosyayı üretir; sonuçlar yine akarak yazılır
+                for n, data, cpu, chunk_nodes in pool.imap(_generate_chunk, tasks):
+                    f.write(data)
+                    lengths.extend(_length_at(data, rec_size, grid_size, i) for i in range(n))
+                    written += n
+                    cpu_time += cpu
+                    nodes += chunk_nodes
+                    elapsed = time.perf_counter() - started
+                    print(f"\r[{grid_size}x{grid_size}] {written}/{count} tahta, "
+                          f"{written / elapsed:,.0f} tahta/sn", end="", flush=True)
+            # Uzunluğa göre counting sort: starts[L] = L uzunluklu ilk kaydın indeks konumu
+            table_len = (max(lengths) if lengths else 0) + 2
+            starts = [0] * table_len
+            for length in lengths:
+                starts[length + 1] += 1
+            for i in range(1, table_len):
+                starts[i] += starts[i - 1]
+            index = array.array("I", bytes(4 * written))
+            fill = starts[:]
+            for record, length in enumerate(lengths):
+                index[fill[length]] = record
+                fill[length] += 1
+            if sys.byteorder != "little":
+                index.byteswap()
+
+            index_offset = f.tell()
+            f.write(struct.pack(f"<{table_len}I", *starts))
+            f.write(index.tobytes())
+            f.seek(0)
+            f.write(struct.pack(HEADER_FORMAT, BANK_MAGIC, BANK_VERSION, grid_size, rec_size, written,
+                                index_offset, table_len))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    print()
+
+    if written:
+        os.replace(tmp_path, path)
+    else:
+        # Boş bir üretim mevcut iyi bankanın yerine geçmesin
+        os.remove(tmp_path)
+        print(f"[{grid_size}x{grid_size}] hiç tahta üretilmedi; {path} değiştirilmedi.")
+
+    wall = time.perf_counter() - started
+    throughput = written / wall if wall else 0.0
+    node_throughput = nodes / wall if wall else 0.0
+    return {
+        "grid_size": grid_size,
+        "path": path,
+        "boards": written,
+        "workers": workers,
+        "wall_time": wall,
+        "cpu_time": cpu_time,
+        "throughput": throughput,
+        "throughput_per_core": throughput / workers,
+        # Worker'ların pool süresince CPU'yu ne kadar meşgul ettiği (hız kazancı değil)
+        "cpu_utilization": cpu_time / (wall * workers) if wall else 0.0,
+        "node_throughput": node_throughput,
+        "single_worker_node_throughput": single_worker,
+        # Tek worker'a göre gerçek hız kazancı (düğüm/sn); 1.0 = tam doğrusal ölçeklenme
+        "speedup": node_throughput / single_worker if single_worker else None,
+        "scaling_efficiency": node_throughput / (workers * single_worker) if single_worker else None,
+    }
+
+
+def summarize_bank(bank):
+    """Zorluk kalibrasyonu için banka üzerinde çözüm uzunluğu dağılımını özetler."""
+    optimal = 0
+    branching_total = 0.0
+    for i in range(len(bank)):
+        rec = bank[i]
+        optimal += rec["optimal"]
+        branching_total += rec["effective_branching"]
+    return {
+        "lengths": bank.length_counts(),
+        "optimal_ratio": optimal / len(bank) if len(bank) else 0.0,
+        "mean_branching": branching_total / len(bank) if len(bank) else 0.0,
+    }
+
+
+def _int_at_least(minimum, description):
+    """argparse type=: en az minimum olan tam sayı; aksi halde traceback yerine kullanım hatası."""
+    def parse(value):
+        try:
+            number = int(value)
+        except ValueError:
+            number = None
+        if number is None or number < minimum:
+            raise argparse.ArgumentTypeError(f"{description} bir tam sayı olmalı: {value}")
+        return number
+    return parse
+
+
+_positive_int = _int_at_least(1, "pozitif")
+_non_negative_int = _int_at_least(0, "negatif olmayan")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Socitek Puzzle toplu tahta üretici / zorluk kalibrasyonu")
+    parser.add_argument("--grid-sizes", type=int, nargs="+", default=list(SUPPORTED_GRID_SIZES),
+                        choices=SUPPORTED_GRID_SIZES)
+    parser.add_argument("--count", type=_non_negative_int, default=10000, help="Her grid boyutu için tahta sayısı")
+    parser.add_argument("--workers", type=_positive_int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=_positive_int, default=500, help="Worker görevi başına tahta sayısı")
+    parser.add_argument("--node-limit", type=_positive_int, default=DEFAULT_NODE_LIMIT,
+                        help="IDA* düğüm bütçesi; aşılırsa alt sınır kaydedilir")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--baseline-seconds", type=float, default=2.0,
+                        help="Ölçeklenme karşılaştırması için tek süreçte ölçüm süresi (0 = atla)")
+    parser.add_argument("--output-dir", default=PUZZLE_BANK_FOLDER)
+    parser.add_argument("--summary", action="store_true", help="Üretim sonrası uzunluk dağılımını yazdır")
+    args = parser.parse_args(argv)
+
+    for grid_size in args.grid_sizes:
+        report = generate_bank(grid_size, args.count, args.workers, args.chunk_size,
+                               args.node_limit, args.seed, args.output_dir, args.baseline_seconds)
+        print(f"{report['path']}: {report['boards']} tahta, {report['wall_time']:.2f} sn, "
+              f"{report['throughput']:,.0f} tahta/sn toplam, "
+              f"{report['throughput_per_core']:,.0f} tahta/sn/çekirdek, "
+              f"CPU kullanımı %{report['cpu_utilization'] * 100:.0f}")
+        if report["scaling_efficiency"] is not None:
+            print(f"  {report['node_throughput']:,.0f} düğüm/sn, tek worker "
+                  f"{report['single_worker_node_throughput']:,.0f} düğüm/sn, "
+                  f"hızlanma {report['speedup']:.2f}x ({report['workers']} worker), "
+                  f"ölçeklenme verimi %{report['scaling_efficiency'] * 100:.0f}")
+        if args.summary and report["boards"]:
+            bank = PuzzleBank(report["path"])
+            summary = summarize_bank(bank)
+            bank.close()
+            print(f"  optimal oranı: %{summary['optimal_ratio'] * 100:.1f}, "
+                  f"ortalama etkin dallanma: {summary['mean_branching']:.3f}")
+            print("  uzunluk dağılımı:", summary["lengths"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,16 +2,18 @@
 import pygame
 import random
 from settings import *
+from surface_utils import prepare_surface, register_surface
 
 
 class PuzzleManager:
     """
     PuzzleManager artık dinamik grid_size desteği içerir.
-    __init__(image, grid_size=None)
+    __init__(image, grid_size=None, board=None)
       - image: pygame Surface
       - grid_size: 2,3,4 vb. (None -> settings.GRID_SIZE kullanılır)
+      - board: (grid, blank_pos) -> PuzzleBank.sample() çıktısı; None ise rastgele karıştırılır
     """
-    def __init__(self, image, grid_size=None):
+    def __init__(self, image, grid_size=None, board=None):
         print("PuzzleManager başlatıldı.")
         if grid_size is None:
             self.grid_size = GRID_SIZE
@@ -19,16 +21,17 @@ class PuzzleManager:
             self.grid_size = grid_size
 
         # Tahtayı PUZZLE_BOARD_SIZE olarak scale et
-        self.original_image = pygame.transform.scale(image, (PUZZLE_BOARD_SIZE, PUZZLE_BOARD_SIZE))
+        self.original_image = prepare_surface(
+            pygame.transform.scale(image, (PUZZLE_BOARD_SIZE, PUZZLE_BOARD_SIZE)), "puzzle_image")
         self.tiles = []         # id -> Surface (list)
         self.grid = []          # 2D list of tile ids
         self.solved_grid = []   # hedef grid (2D)
         self.blank_pos = (0, 0)
         self.blank_tile_id = None
         self.tile_size = PUZZLE_BOARD_SIZE // self.grid_size
-        self.create_puzzle()
+        self.create_puzzle(board)
 
-    def create_puzzle(self):
+    def create_puzzle(self, board=None):
         print("Puzzle oluşturuluyor...")
         self.tiles.clear()
         self.grid.clear()
@@ -38,8 +41,9 @@ class PuzzleManager:
         for y in range(self.grid_size):
             for x in range(self.grid_size):
                 rect = pygame.Rect(x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size)
-                # copy ile parent'a bağlı kalmaz
-                tile_image = self.original_image.subsurface(rect).copy()
+                # copy ile parent'a bağlı kalmaz; original_image hazır olduğundan format zaten doğru
+                tile_image = register_surface(self.original_image.subsurface(rect).copy(), f"tile_{tile_id}",
+                                              source=self.original_image)
                 self.tiles.append(tile_image)
                 tile_id += 1
 
@@ -50,6 +54,13 @@ class PuzzleManager:
         self.blank_tile_id = (self.grid_size * self.grid_size) - 1
         self.blank_pos = (self.grid_size - 1, self.grid_size - 1)
 
+        if board is not None:
+            grid, blank_pos = board
+            self.grid = [list(row) for row in grid]
+            self.blank_pos = tuple(blank_pos)
+            print("Puzzle başarıyla oluşturuldu. Önceden üretilmiş tahta yüklendi.")
+            return
+
         print("Puzzle başarıyla oluşturuldu. Karıştırılıyor...")
         self.shuffle_puzzle()
 
@@ -36,3 +36,19 @@ IMAGES_FOLDER_ORTA = "images/normal"
 IMAGES_FOLDER_ZOR = "images/hard"
 
 BACKGROUND_IMAGE_PATH = "bg/neon_bg.png"
+
+# puzzle_generator.py ile üretilen önceden hesaplanmış tahtalar (grid_<n>.bin)
+PUZZLE_BANK_FOLDER = "puzzle_bank"
+
+# Zorluk başına bankadan örneklenecek çözüm uzunluğu aralığı (hamle, dahil).
+# kolay=2x2 (en fazla 6), orta=3x3 (en fazla 31), zor=4x4. 4x4 kayıtlarının çoğu
+# düğüm bütçesine takılır; o kayıtlarda uzunluk kanıtlanmış alt sınırdır.
+DIFFICULTY_SOLUTION_LENGTHS = {
+    "kolay": (4, 6),
+    "orta": (18, 24),
+    "zor": (40, 52),
+}
+
+# Surface'ları gerçek saydamlığa göre ekran formatına çevir (surface_utils.py)
+# False -> her şey convert_alpha() ile yüklenir (eski davranış)
+OPTIMIZE_SURFACES = True
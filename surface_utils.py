@@ -0,0 +1,159 @@
+# surface_utils.py
+"""
+Yükleyiciler, önbellekler ve PuzzleManager için ortak surface hazırlama katmanı.
+
+prepare_surface() bir görüntüde gerçekten saydamlık olup olmadığına bakar ve
+onu ekranın piksel formatına çevirir:
+  - tamamen opak      -> convert()                  (düz, harmanlamasız blit)
+  - yalnızca 0/255 alfa -> convert() + colorkey + RLEACCEL
+  - gerçek yarı saydam -> convert_alpha()
+Hazırlanan surface'lar isimleriyle kaydedilir; surface_report() her biri için
+bellek kullanımını ve ölçülen blit maliyetini raporlar.
+"""
+import os
+import time
+import weakref
+
+import pygame
+from settings import *
+
+# Colorkey dönüşümünde saydam pikseller için kullanılan renk (görüntüde opak olarak geçmemeli)
+COLORKEY = (255, 0, 255)
+
+# False -> eski davranış (her şey convert_alpha, sabit katmanlar önceden birleştirilmez);
+# benchmark karşılaştırması için
+enabled = OPTIMIZE_SURFACES
+
+# isim -> Surface; surface'ı canlı tutmaz, puzzle değişince eski tile'lar kendiliğinden düşer
+_assets = weakref.WeakValueDictionary()
+
+
+def has_transparency(surface):
+    """Surface'ta görünür etkisi olan saydam/yarı saydam piksel var mı?"""
+    if surface.get_colorkey() is not None:
+        return True
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return False
+    w, h = surface.get_size()
+    # threshold=254 -> yalnızca alfa'sı 255 olan pikseller işaretlenir
+    return pygame.mask.from_surface(surface, 254).count() < w * h
+
+
+def _to_colorkey(surface):
+    """Alfa'sı yalnızca 0/255 olan surface'ı colorkey + RLE surface'a çevirir; uygun değilse None."""
+    visible = pygame.mask.from_surface(surface, 0)
+    if visible.count() != pygame.mask.from_surface(surface, 254).count():
+        return None  # yarı saydam pikseller var
+    key_pixels = pygame.mask.from_threshold(surface, COLORKEY, (1, 1, 1, 255))
+    if key_pixels.overlap_area(visible, (0, 0)):
+        return None  # colorkey rengi görüntüde opak olarak kullanılıyor
+    keyed = pygame.Surface(surface.get_size()).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(surface, (0, 0))
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def prepare_surface(surface, name=None):
+    """
+    Surface'ı ekran formatına çevirip döner. Ekran modu henüz açılmadıysa
+    (convert başarısız olursa) surface olduğu gibi döner.
+    name verilirse surface_report() için kaydedilir.
+    """
+    try:
+        if not enabled:
+            prepared = surface.convert_alpha()
+        elif not has_transparency(surface):
+            prepared = surface.convert()
+        else:
+            prepared = _to_colorkey(surface) or surface.convert_alpha()
+    except pygame.error:
+        prepared = surface
+    return register_surface(prepared, name)
+
+
+def register_surface(surface, name=None, source=None):
+    """
+    Zaten hazırlanmış bir surface'tan türetilen surface'ı (subsurface kopyası,
+    ölçeklenmiş hali) yeniden çevirmeden surface_report() için kaydeder.
+    source verilirse onun colorkey'i ve RLE bayrağı yeniden uygulanır;
+    copy() ve transform.scale() colorkey'i korusa da RLEACCEL'i düşürür.
+    """
+    if source is not None:
+        key = source.get_colorkey()
+        if key is not None:
+            rle = source.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK)
+            surface.set_colorkey(key, pygame.RLEACCEL if rle else 0)
+    if name:
+        _assets[name] = surface
+    return surface
+
+
+def load_surface(path, name=None):
+    """pygame.image.load + prepare_surface. Hata durumunda pygame.error fırlatır."""
+    return prepare_surface(pygame.image.load(path), name or os.path.basename(path))
+
+
+def make_overlay(size, color, alpha, name=None):
+    """
+    Tek renkli yarı saydam katman (bir kez oluşturulup tekrar kullanılmak için).
+    SDL2'de surface alfa'lı blit, ekran formatındaki piksel başı alfa blitinden
+    yavaş olduğundan convert_alpha() yolu korunur.
+    """
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill((*color, alpha))
+    return prepare_surface(overlay, name)
+
+
+def _describe(surface):
+    flags = surface.get_flags()
+    if surface.get_colorkey() is not None:
+        mode = "colorkey+RLE" if flags & (pygame.RLEACCEL | pygame.RLEACCELOK) else "colorkey"
+    elif flags & pygame.SRCALPHA:
+        mode = "per-pixel alpha"
+    else:
+        mode = "opaque"
+    return mode
+
+
+def surface_report(repeats=200):
+    """
+    Kayıtlı her surface için bellek ve blit maliyetini ölçer.
+    Blitler ekran formatındaki geçici bir hedefe yapılır; ekran bozulmaz.
+    Döner: [{name, size, bytes_per_pixel, memory_bytes, mode, blit_us}, ...]
+    """
+    display = pygame.display.get_surface()
+    target = pygame.Surface(display.get_size() if display else (WINDOW_WIDTH, WINDOW_HEIGHT))
+    if display:
+        target = target.convert()
+
+    report = []
+    for name, surface in sorted(_assets.items(), key=lambda item: item[0]):
+        target.blit(surface, (0, 0))  # ilk blit RLE kodlamasını tetikler, ölçüme katma
+        started = time.perf_counter()
+        for _ in range(repeats):
+            target.blit(surface, (0, 0))
+        blit_us = (time.perf_counter() - started) / repeats * 1e6
+        report.append({
+            "name": name,
+            "size": surface.get_size(),
+            "bytes_per_pixel": surface.get_bytesize(),
+            # RLE surface'larda gerçek kodlanmış boyut SDL içinde; burada piksel tamponu raporlanır
+            "memory_bytes": surface.get_pitch() * surface.get_height(),
+            "mode": _describe(surface),
+            "blit_us": blit_us,
+        })
+    return report
+
+
+def print_surface_report(repeats=200):
+    report = surface_report(repeats)
+    total = 0
+    print(f"{'asset':<28}{'boyut':>12}{'bpp':>5}{'bellek KB':>12}{'blit µs':>10}  mod")
+    for row in report:
+        total += row["memory_bytes"]
+        w, h = row["size"]
+        print(f"{row['name']:<28}{f'{w}x{h}':>12}{row['bytes_per_pixel']:>5}"
+              f"{row['memory_bytes'] / 1024:>12.1f}{row['blit_us']:>10.1f}  {row['mode']}")
+    print(f"Toplam surface belleği: {total / 1024:.1f} KB")
+    return report
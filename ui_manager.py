@@ -1,6 +1,8 @@
 import pygame
 import os
 from settings import *
+import surface_utils
+from surface_utils import prepare_surface, register_surface, make_overlay
 
 
 class UIManager:
@@ -25,8 +27,10 @@ class UIManager:
         self.background_image = None
         if os.path.exists(BACKGROUND_IMAGE_PATH):
             try:
-                temp_img = pygame.image.load(BACKGROUND_IMAGE_PATH).convert_alpha()
-                self.background_image = pygame.transform.scale(temp_img, (WINDOW_WIDTH, WINDOW_HEIGHT))
+                # Kaynak boyutunda çevirmeye gerek yok; ölçeklendikten sonra bir kez hazırlanır
+                temp_img = pygame.image.load(BACKGROUND_IMAGE_PATH)
+                self.background_image = prepare_surface(
+                    pygame.transform.scale(temp_img, (WINDOW_WIDTH, WINDOW_HEIGHT)), "background")
                 print(f"Arka plan resmi yüklendi: {BACKGROUND_IMAGE_PATH}")
             except pygame.error as e:
                 print(f"Arka plan resmi yüklenirken hata oluştu: {e}")
@@ -37,8 +41,27 @@ class UIManager:
             Y_MARGIN, Y_MARGIN,
             WINDOW_WIDTH - Y_MARGIN * 2, WINDOW_HEIGHT - Y_MARGIN * 2
         )
-        self.puzzle_overlay_surface = pygame.Surface(self.puzzle_display_area_rect.size, pygame.SRCALPHA)
-        self.puzzle_overlay_surface.fill((0, 0, 0, 150))
+        self.puzzle_overlay_surface = make_overlay(self.puzzle_display_area_rect.size, BLACK, 150,
+                                                   "puzzle_overlay")
+        # Pause ve kazanma ekranı için tam ekran karartma (her karede yeniden oluşturulmaz)
+        self.dim_overlay = make_overlay((WINDOW_WIDTH, WINDOW_HEIGHT), BLACK, 180, "dim_overlay")
+
+        # Oyun ekranında arka plan + karartma katmanı sabit; tek opak surface'ta birleştir
+        self.game_background = None
+        if surface_utils.enabled:
+            composed = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            if self.background_image:
+                composed.blit(self.background_image, (0, 0))
+            else:
+                composed.fill(DARK_BLUE_BG)
+            composed.blit(self.puzzle_overlay_surface, self.puzzle_display_area_rect.topleft)
+            self.game_background = prepare_surface(composed, "game_background")
+
+        # Referans resim her karede yeniden ölçeklenmez; kaynak surface değişince yenilenir
+        self._ref_source = None
+        self._ref_image = None
+        # Sabit yazılar (başlıklar, buton etiketleri) bir kez render edilir
+        self._text_cache = {}
 
     def _draw_background(self):
         if self.background_image:
@@ -46,10 +69,27 @@ class UIManager:
         else:
             self.screen.fill(DARK_BLUE_BG)
 
+    def _render_static(self, font, text, color):
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _get_reference_image(self, puzzle, size):
+        if self._ref_source is not puzzle.original_image:
+            self._ref_source = puzzle.original_image
+            # original_image hazır; ölçeklenmiş hali aynı formatta kalır
+            self._ref_image = register_surface(
+                pygame.transform.scale(puzzle.original_image, (size, size)), "reference_image",
+                source=puzzle.original_image)
+        return self._ref_image
+
     def draw_menu(self, hand_data, hovered_key=None):
         self._draw_background()
 
-        title = self.big_font.render("DÜZEY SEÇİN", True, NEON_ORANGE)
+        title = self._render_static(self.big_font, "DÜZEY SEÇİN", NEON_ORANGE)
         self.screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 80))
 
         buttons = []
@@ -62,7 +102,7 @@ class UIManager:
             base_color = NEON_ORANGE if is_hover else NEON_BLUE
 
             pygame.draw.rect(self.screen, base_color, rect, border_radius=14)
-            txt = self.font.render(label, True, WHITE)
+            txt = self._render_static(self.font, label, WHITE)
             self.screen.blit(txt, (rect.centerx - txt.get_width() // 2, rect.centery - txt.get_height() // 2))
             pygame.draw.rect(self.screen, NEON_GREEN if is_hover else NEON_BLUE, rect, 3 if is_hover else 2,
                              border_radius=14)
@@ -73,11 +113,14 @@ class UIManager:
         return buttons
 
     def draw_game(self, hand_data, puzzle, game_state, elapsed_time):
-        self._draw_background()
-        self.screen.blit(self.puzzle_overlay_surface, self.puzzle_display_area_rect.topleft)
+        if self.game_background:
+            self.screen.blit(self.game_background, (0, 0))
+        else:
+            self._draw_background()
+            self.screen.blit(self.puzzle_overlay_surface, self.puzzle_display_area_rect.topleft)
 
         ref_w = int(PUZZLE_BOARD_SIZE * 0.5)
-        ref_image = pygame.transform.scale(puzzle.original_image, (ref_w, ref_w))
+        ref_image = self._get_reference_image(puzzle, ref_w)
         self.screen.blit(ref_image, (Y_MARGIN, Y_MARGIN))
         pygame.draw.rect(self.screen, NEON_BLUE, (Y_MARGIN, Y_MARGIN, ref_w, ref_w), 2, border_radius=8)
 
@@ -91,11 +134,9 @@ class UIManager:
         pygame.display.flip()
 
     def draw_pause(self, hand_data, hovered_key=None):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
 
-        title = self.big_font.render("DURDURULDU", True, NEON_ORANGE)
+        title = self._render_static(self.big_font, "DURDURULDU", NEON_ORANGE)
         self.screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 120))
 
         buttons = {}
@@ -110,7 +151,7 @@ class UIManager:
             color = NEON_GREEN if is_hover else NEON_BLUE
 
             pygame.draw.rect(self.screen, color, rect, border_radius=14)
-            txt = self.font.render(label, True, WHITE)
+            txt = self._render_static(self.font, label, WHITE)
             self.screen.blit(txt, (rect.centerx - txt.get_width() // 2, rect.centery - txt.get_height() // 2))
             buttons[key] = rect
 
@@ -127,11 +168,9 @@ class UIManager:
         self.screen.blit(text_surf, text_rect)
 
     def _draw_win_screen(self, final_time):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
 
-        win_text = self.big_font.render("TEBRİKLER!", True, NEON_ORANGE)
+        win_text = self._render_static(self.big_font, "TEBRİKLER!", NEON_ORANGE)
         win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
         self.screen.blit(win_text, win_rect)
 